@@ -5,6 +5,7 @@
 # Uso: ./run_all.sh [opções]
 #   --clean     Limpa antes de compilar
 #   --no-plot   Não gera gráficos (mais rápido)
+#   --no-report Não gera o relatório HTML
 #
 
 set -e  # Para no primeiro erro
@@ -19,6 +20,7 @@ NC='\033[0m' # No Color
 # Parse argumentos
 CLEAN=false
 PLOT=true
+REPORT=true
 
 for arg in "$@"; do
     case $arg in
@@ -28,12 +30,16 @@ for arg in "$@"; do
         --no-plot)
             PLOT=false
             ;;
+        --no-report)
+            REPORT=false
+            ;;
         --help|-h)
             echo "Uso: ./run_all.sh [opções]"
             echo ""
             echo "Opções:"
             echo "  --clean     Limpa antes de compilar"
             echo "  --no-plot   Não gera gráficos (mais rápido)"
+            echo "  --no-report Não gera o relatório HTML"
             echo "  --help, -h  Mostra esta ajuda"
             exit 0
             ;;
@@ -108,6 +114,24 @@ for i in "${!TASKS[@]}"; do
     echo ""
 done
 
+# Gera relatório HTML consolidado (incremental)
+if [ "$REPORT" = true ]; then
+    echo -e "${YELLOW}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
+    echo -e "${YELLOW}  Relatório HTML${NC}"
+    echo -e "${YELLOW}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
+    echo ""
+    
+    cd "$ROOT_DIR/src/report"
+    if make report; then
+        echo -e "${GREEN}      ✓ Relatório gerado${NC}"
+    else
+        echo -e "${RED}      ✗ Erro ao gerar relatório${NC}"
+        exit 1
+    fi
+    
+    echo ""
+fi
+
 # Volta para raiz
 cd "$ROOT_DIR"
 
@@ -126,5 +150,6 @@ echo "  - results/saxpy/charts/           (gráficos Tarefa C)"
 echo "  - results/saxpy/table/            (dados Tarefa C)"
 echo "  - results/parallel_region/charts/ (gráficos Tarefa D)"
 echo "  - results/parallel_region/table/  (dados Tarefa D)"
+echo "  - results/report/index.html       (relatório HTML interativo)"
 echo ""
 
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+report.py - Gera relatório HTML interativo com os resultados das Tarefas C e D
+
+Lê as tabelas CSV de todas as tarefas uma única vez e escreve um único
+arquivo HTML autocontido (sem dependências externas), com os dados
+embutidos em JSON e filtros/gráficos renderizados no navegador.
+
+A geração é incremental: cada seção (tarefa, N) guarda o hash das linhas
+de origem em um cache, e apenas as seções cujas linhas mudaram são
+renderizadas novamente.
+
+Dependências: nenhuma (somente biblioteca padrão do Python)
+"""
+
+import argparse
+import csv
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+
+# Diretórios
+RESULTS_DIR = "../../results"
+REPORT_DIR = f"{RESULTS_DIR}/report"
+OUTPUT_FILE = f"{REPORT_DIR}/index.html"
+CACHE_FILE = f"{REPORT_DIR}/cache.json"
+
+# Tarefas incluídas no relatório (na ordem de exibição)
+TASKS = [
+    ('saxpy', 'Tarefa C — SAXPY (Vetorização SIMD)'),
+    ('parallel_region', 'Tarefa D — Organização de Região Paralela'),
+]
+
+# Configuração de experimentos
+NUM_RUNS = 5
+
+# Dígitos significativos mantidos nos valores embutidos
+SIGNIFICANT_DIGITS = 6
+
+def renderer_fingerprint():
+    """Identifica o renderizador pelo hash deste arquivo.
+
+    Qualquer mudança no código ou na configuração acima (títulos, markup,
+    SIGNIFICANT_DIGITS...) invalida as seções em cache.
+    """
+    with open(os.path.abspath(__file__), 'rb') as f:
+        source = f.read()
+    return hashlib.sha256(source).hexdigest()
+
+def load_data(filename):
+    """Carrega dados do CSV de resultados (lista vazia se não existir)."""
+    if not os.path.exists(filename):
+        print(f"  Aviso: arquivo {filename} não encontrado, tarefa ignorada.")
+        return []
+
+    data = []
+    with open(filename, 'r') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            data.append({
+                'versao': row['versao'],
+                'n': int(row['n']),
+                'threads': int(row['threads']),
+                'tempo_medio': float(row['tempo_medio']),
+                'desvio_padrao': float(row['desvio_padrao'])
+            })
+    return data
+
+def filter_data(data, **kwargs):
+    """Filtra dados por critérios."""
+    result = data
+    for key, value in kwargs.items():
+        result = [d for d in result if d.get(key) == value]
+    return result
+
+def get_unique(data, key):
+    """Retorna valores únicos de uma chave."""
+    return sorted(set(d[key] for d in data))
+
+def load_cache(filename=CACHE_FILE):
+    """Carrega o cache de seções já renderizadas."""
+    if not os.path.exists(filename):
+        return {}
+    try:
+        with open(filename, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        print("  Aviso: cache inválido, todas as seções serão renderizadas.")
+        return {}
+    if cache.get('versao') != renderer_fingerprint():
+        print("  Renderizador alterado, todas as seções serão renderizadas.")
+        return {}
+    return cache.get('secoes', {})
+
+def save_cache(sections, filename=CACHE_FILE):
+    """Salva o cache de seções renderizadas."""
+    with open(filename, 'w') as f:
+        json.dump({'versao': renderer_fingerprint(), 'secoes': sections}, f)
+
+def rows_hash(rows):
+    """Hash estável das linhas de origem de uma seção."""
+    key = sorted((r['versao'], r['n'], r['threads'], r['tempo_medio'], r['desvio_padrao'])
+                 for r in rows)
+    return hashlib.sha256(json.dumps(key).encode('utf-8')).hexdigest()
+
+def round_sig(value):
+    """Arredonda para SIGNIFICANT_DIGITS dígitos significativos."""
+    return float(f"{value:.{SIGNIFICANT_DIGITS}g}")
+
+def build_series(rows):
+    """Monta as séries (por versão) embutidas no JSON de uma seção."""
+    seq_data = filter_data(rows, versao='seq')
+    seq_time = seq_data[0]['tempo_medio'] if seq_data else 0
+
+    series = {}
+    for versao in get_unique(rows, 'versao'):
+        points = sorted(filter_data(rows, versao=versao), key=lambda x: x['threads'])
+        series[versao] = [
+            [d['threads'],
+             round_sig(d['tempo_medio'] * 1000),
+             round_sig(d['desvio_padrao'] * 1000),
+             round_sig(seq_time / d['tempo_medio']) if d['tempo_medio'] > 0 and seq_time else 0]
+            for d in points
+        ]
+    return series
+
+def render_section(task, title, n, rows):
+    """Renderiza o HTML de uma seção (tarefa, N)."""
+    section_id = f"{task}-{n}"
+    seq_data = filter_data(rows, versao='seq')
+    seq_time = seq_data[0]['tempo_medio'] if seq_data else 0
+
+    lines = [
+        f'<section class="secao" id="{section_id}" data-tarefa="{task}" data-n="{n}">',
+        f'<h3>{html.escape(title)} — N = {n:,}</h3>',
+        f'<div class="grafico" data-secao="{section_id}"></div>',
+        '<table>',
+        '<thead><tr><th>Versão</th><th>Threads</th><th>Tempo Médio (ms)</th>'
+        '<th>Desvio Padrão (ms)</th><th>Speedup</th></tr></thead>',
+        '<tbody>',
+    ]
+    for row in sorted(rows, key=lambda x: (x['versao'], x['threads'])):
+        speedup = seq_time / row['tempo_medio'] if row['tempo_medio'] > 0 and seq_time else 0
+        lines.append(
+            f'<tr data-threads="{row["threads"]}">'
+            f'<td>{html.escape(row["versao"])}</td>'
+            f'<td>{row["threads"]}</td>'
+            f'<td>{row["tempo_medio"]*1000:.4f}</td>'
+            f'<td>{row["desvio_padrao"]*1000:.4f}</td>'
+            f'<td>{speedup:.2f}x</td></tr>'
+        )
+    lines += ['</tbody>', '</table>', '</section>']
+    return '\n'.join(lines)
+
+def update_sections(cache, force=False):
+    """Atualiza as seções, renderizando apenas as que mudaram."""
+    sections = {}
+    rendered = 0
+    for task, title in TASKS:
+        data = load_data(f"{RESULTS_DIR}/{task}/table/results.csv")
+        for n in get_unique(data, 'n'):
+            section_id = f"{task}-{n}"
+            rows = filter_data(data, n=n)
+            digest = rows_hash(rows)
+            cached = cache.get(section_id)
+            if not force and cached and cached.get('hash') == digest:
+                sections[section_id] = cached
+                continue
+            sections[section_id] = {
+                'hash': digest,
+                'tarefa': task,
+                'n': n,
+                'threads': get_unique(rows, 'threads'),
+                'html': render_section(task, title, n, rows),
+                'dados': build_series(rows),
+            }
+            rendered += 1
+            print(f"  ✓ seção {section_id} renderizada")
+    return sections, rendered
+
+def render_page(sections):
+    """Monta a página completa a partir das seções renderizadas."""
+    task_names = dict(TASKS)
+    n_values = sorted(set(s['n'] for s in sections.values()))
+    thread_values = sorted(set(t for s in sections.values() for t in s['threads']))
+
+    def checkboxes(name, values, fmt):
+        return ''.join(f'<label><input type="checkbox" name="{name}" value="{v}" checked> '
+                       f'{fmt(v)}</label>' for v in values)
+
+    task_options = ''.join(f'<option value="{task}">{html.escape(task_names[task])}</option>'
+                           for task, _ in TASKS
+                           if any(s['tarefa'] == task for s in sections.values()))
+
+    body = []
+    for task, title in TASKS:
+        task_sections = [s for s in sections.values() if s['tarefa'] == task]
+        if not task_sections:
+            continue
+        body.append(f'<h2 data-tarefa="{task}">{html.escape(title)}</h2>')
+        body += [s['html'] for s in sorted(task_sections, key=lambda s: s['n'])]
+
+    data = {sid: s['dados'] for sid, s in sections.items()}
+    # Evita que "</script>" dentro do JSON encerre o bloco
+    data_json = json.dumps(data, separators=(',', ':')).replace('</', '<\\/')
+
+    return PAGE_TEMPLATE.format(
+        num_runs=NUM_RUNS,
+        task_options=task_options,
+        n_checkboxes=checkboxes('n', n_values, lambda v: f'{v:,}'),
+        thread_checkboxes=checkboxes('threads', thread_values, str),
+        body='\n'.join(body),
+        data_json=data_json,
+        script=PAGE_SCRIPT,
+    )
+
+def missing_thread_filters(page):
+    """Threads presentes nas tabelas sem checkbox correspondente no filtro."""
+    checkboxes = set(re.findall(r'name="threads" value="(\d+)"', page))
+    table_rows = set(re.findall(r'data-threads="(\d+)"', page))
+    return sorted(table_rows - checkboxes, key=int)
+
+def write_if_changed(filename, content):
+    """Escreve o arquivo apenas se o conteúdo mudou."""
+    if os.path.exists(filename):
+        with open(filename, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<title>OpenMP na Prática — Relatório de Resultados</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; color: #222; }}
+h2 {{ border-bottom: 2px solid #3498db; padding-bottom: 0.2em; }}
+.filtros {{ background: #f4f6f8; padding: 1em; border-radius: 6px; }}
+.filtros fieldset {{ border: none; display: inline-block; margin-right: 2em; }}
+.filtros label {{ margin-right: 0.8em; }}
+.secao {{ margin-bottom: 2em; }}
+.nota {{ font-style: italic; color: gray; font-size: 0.9em; }}
+table {{ border-collapse: collapse; font-size: 0.9em; }}
+th, td {{ border: 1px solid #ccc; padding: 0.3em 0.8em; text-align: right; }}
+th {{ background: #eee; }}
+td:first-child {{ text-align: left; }}
+svg text {{ font-size: 11px; }}
+</style>
+</head>
+<body>
+<h1>OpenMP na Prática — Relatório de Resultados</h1>
+<p class="nota">Cada ponto: média de {num_runs} execuções. Barras de erro: ±1 desvio padrão.
+Speedup = Tempo_seq / Tempo_versão.</p>
+<form class="filtros" onsubmit="return false">
+<fieldset><legend>Tarefa</legend>
+<select name="tarefa"><option value="">Todas</option>{task_options}</select></fieldset>
+<fieldset><legend>N</legend>{n_checkboxes}</fieldset>
+<fieldset><legend>Threads</legend>{thread_checkboxes}</fieldset>
+</form>
+{body}
+<script id="dados" type="application/json">{data_json}</script>
+<script>
+{script}
+</script>
+</body>
+</html>
+"""
+
+PAGE_SCRIPT = """
+var DADOS = JSON.parse(document.getElementById('dados').textContent);
+var CORES = ['#3498db', '#2ecc71', '#e74c3c', '#9b59b6', '#f39c12', '#1abc9c'];
+var SVG_NS = 'http://www.w3.org/2000/svg';
+
+function marcados(nome) {
+  var caixas = document.querySelectorAll('input[name="' + nome + '"]:checked');
+  return Array.prototype.map.call(caixas, function (c) { return Number(c.value); });
+}
+
+function svg(tag, attrs, texto) {
+  var el = document.createElementNS(SVG_NS, tag);
+  for (var k in attrs) el.setAttribute(k, attrs[k]);
+  if (texto !== undefined) el.textContent = texto;
+  return el;
+}
+
+// Tempo médio (ms) por número de threads. Versões com um único ponto
+// (seq e simd, medidas só com 1 thread) aparecem como linha horizontal de
+// referência. O filtro de threads vale para todas as séries, como na tabela.
+function desenhar(container, series, threads) {
+  container.innerHTML = '';
+  var L = 560, A = 260, m = {e: 60, d: 140, t: 15, b: 35};
+  var eixoX = threads.slice().sort(function (a, b) { return a - b; });
+  var visiveis = {};
+  var maxY = 0;
+  Object.keys(series).forEach(function (v) {
+    visiveis[v] = series[v].filter(function (p) { return eixoX.indexOf(p[0]) >= 0; });
+    visiveis[v].forEach(function (p) { maxY = Math.max(maxY, p[1] + p[2]); });
+  });
+  if (!eixoX.length || maxY === 0) return;
+  var px = function (t) {
+    var i = eixoX.indexOf(t);
+    return m.e + (eixoX.length > 1 ? i / (eixoX.length - 1) : 0.5) * (L - m.e - m.d);
+  };
+  var py = function (y) { return A - m.b - y / maxY * (A - m.t - m.b); };
+  var g = svg('svg', {width: L, height: A});
+  g.appendChild(svg('line', {x1: m.e, y1: py(0), x2: L - m.d, y2: py(0), stroke: '#333'}));
+  g.appendChild(svg('line', {x1: m.e, y1: py(0), x2: m.e, y2: py(maxY), stroke: '#333'}));
+  eixoX.forEach(function (t) {
+    g.appendChild(svg('text', {x: px(t), y: A - m.b + 15, 'text-anchor': 'middle'}, t));
+  });
+  [0, 0.5, 1].forEach(function (f) {
+    g.appendChild(svg('text', {x: m.e - 5, y: py(maxY * f) + 4, 'text-anchor': 'end'},
+                      (maxY * f).toPrecision(3)));
+  });
+  g.appendChild(svg('text', {x: (L - m.d + m.e) / 2, y: A - 3, 'text-anchor': 'middle'},
+                    'Número de Threads'));
+  g.appendChild(svg('text', {x: 12, y: A / 2, transform: 'rotate(-90 12 ' + A / 2 + ')',
+                             'text-anchor': 'middle'}, 'Tempo médio (ms)'));
+  var legenda = 0;
+  Object.keys(series).forEach(function (v, i) {
+    var cor = CORES[i % CORES.length];
+    var pontos = visiveis[v];
+    if (!pontos.length) return;
+    if (series[v].length === 1) {
+      g.appendChild(svg('line', {x1: m.e, x2: L - m.d, y1: py(pontos[0][1]), y2: py(pontos[0][1]),
+                                 stroke: cor, 'stroke-dasharray': '4 3'}));
+    } else {
+      g.appendChild(svg('polyline', {fill: 'none', stroke: cor, 'stroke-width': 2,
+        points: pontos.map(function (p) { return px(p[0]) + ',' + py(p[1]); }).join(' ')}));
+      pontos.forEach(function (p) {
+        g.appendChild(svg('line', {x1: px(p[0]), x2: px(p[0]), y1: py(p[1] - p[2]),
+                                   y2: py(p[1] + p[2]), stroke: cor}));
+        var c = svg('circle', {cx: px(p[0]), cy: py(p[1]), r: 4, fill: cor});
+        c.appendChild(svg('title', {}, v + ': ' + p[1] + ' ms (' + p[3] + 'x)'));
+        g.appendChild(c);
+      });
+    }
+    g.appendChild(svg('text', {x: L - m.d + 10, y: m.t + 15 * legenda++ + 5, fill: cor}, v));
+  });
+  container.appendChild(g);
+}
+
+function atualizar() {
+  var tarefa = document.querySelector('select[name="tarefa"]').value;
+  var ns = marcados('n');
+  var threads = marcados('threads');
+  document.querySelectorAll('h2[data-tarefa]').forEach(function (h) {
+    h.style.display = (!tarefa || h.dataset.tarefa === tarefa) ? '' : 'none';
+  });
+  document.querySelectorAll('.secao').forEach(function (s) {
+    var visivel = (!tarefa || s.dataset.tarefa === tarefa) && ns.indexOf(Number(s.dataset.n)) >= 0;
+    s.style.display = visivel ? '' : 'none';
+    if (!visivel) return;
+    s.querySelectorAll('tbody tr').forEach(function (tr) {
+      tr.style.display = threads.indexOf(Number(tr.dataset.threads)) >= 0 ? '' : 'none';
+    });
+    desenhar(s.querySelector('.grafico'), DADOS[s.id], threads);
+  });
+}
+
+document.querySelector('.filtros').addEventListener('change', atualizar);
+atualizar();
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera relatório HTML interativo dos resultados.")
+    parser.add_argument('--force', action='store_true',
+                        help="Renderiza todas as seções, ignorando o cache")
+    args = parser.parse_args()
+
+    print("=== Gerando relatório HTML (Tarefas C e D) ===\n")
+
+    os.makedirs(REPORT_DIR, exist_ok=True)
+
+    cache = {} if args.force else load_cache()
+    sections, rendered = update_sections(cache, force=args.force)
+
+    if not sections:
+        print("Erro: nenhum resultado encontrado.")
+        print("Execute 'make run' nas tarefas primeiro para gerar os resultados.")
+        sys.exit(1)
+
+    print(f"\n  {rendered} de {len(sections)} seções renderizadas "
+          f"({len(sections) - rendered} reaproveitadas do cache)")
+
+    page = render_page(sections)
+    missing = missing_thread_filters(page)
+    if missing:
+        print(f"Erro: threads sem filtro correspondente: {', '.join(missing)}")
+        print("Execute 'make force' para renderizar todas as seções novamente.")
+        sys.exit(1)
+
+    save_cache(sections)
+    if write_if_changed(OUTPUT_FILE, page):
+        print(f"\n=== Relatório salvo em: {OUTPUT_FILE} ===")
+    else:
+        print(f"\n=== Relatório sem alterações: {OUTPUT_FILE} ===")
+
+if __name__ == '__main__':
+    main()